@@ -4,10 +4,13 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import asyncio
+import gc
 import os
 from typing import Optional
 
 import aiohttp
+import orjson
 from deepgram import LiveOptions
 from dotenv import load_dotenv
 from loguru import logger
@@ -42,6 +45,7 @@ from pipecat.turns.user_start import TranscriptionUserTurnStartStrategy, VADUser
 from pipecat.turns.user_stop import TurnAnalyzerUserTurnStopStrategy
 from pipecat.turns.user_turn_strategies import UserTurnStrategies
 
+from http_session import get_shared_session
 from observers import LatencyBreakdownObserver
 from tools import register_tools
 
@@ -50,36 +54,100 @@ load_dotenv(override=True)
 # Reduce logging noise from empty audio frame warnings
 logger.disable("pipecat.services.stt_service")
 
+# Raise the gen-0 GC threshold so collections don't fire mid-turn (a single
+# turn allocates thousands of short-lived frames), and freeze everything
+# allocated at import so full collections skip the pipecat/model objects.
+# PipelineRunner(force_gc=True) still collects once the call ends.
+gc.set_threshold(50_000, 10, 10)
+gc.freeze()
+
+# Twilio credentials and REST URLs are fixed for the life of the container, so
+# read them once at import instead of on every call.
+_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
+_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
+_TWILIO_AUTH = (
+    aiohttp.BasicAuth(_ACCOUNT_SID, _AUTH_TOKEN) if _ACCOUNT_SID and _AUTH_TOKEN else None
+)
+
+_TWILIO_ACCOUNT_URL = f"https://api.twilio.com/2010-04-01/Accounts/{_ACCOUNT_SID}"
+CALL_URL_TEMPLATE = _TWILIO_ACCOUNT_URL + "/Calls/{call_sid}.json"
+REC_URL_TEMPLATE = _TWILIO_ACCOUNT_URL + "/Calls/{call_sid}/Recordings.json"
+
+# Prompts are identical for every call; each call copies _SYSTEM_MSG so its
+# own message list never mutates the shared dict.
+_SYSTEM_PROMPT = (
+    "You are Miss Harper, an elementary school teacher in an audio call. "
+    "Your output will be converted to audio so don't include special characters in your answers. "
+    "You are an expert in answering questions about elementary school subjects like math, science, history, and literature. "
+    "If the student asks about math, just give the answer without explaining how you got it. "
+    "For other subjects, provide clear and concise explanations suitable for an elementary school student. "
+    "If the student is quiet for a while, you will continue teaching by asking them questions or providing "
+    "interesting facts related to the current topic. Always keep the conversation engaging and educational. "
+    "You are also a storyteller and if asked for a story, you will tell an interesting and age-appropriate story to the student. "
+    "\n\n"
+    "You have access to the following tools:\n"
+    "- You can check today's class schedule when students ask what's next or what subjects are planned for today.\n"
+    "- You can look up word definitions when students ask what a word means.\n"
+    "- You can send a lesson summary via text message when the student asks for one or when the lesson ends.\n"
+    "\n"
+    "Use these tools naturally in conversation. When you use a tool, incorporate the results into your spoken response."
+)
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+_GREETING_PROMPT = "Say hello and introduce yourself as Miss Harper."
+_IDLE_PROMPT = "The student is quiet. Continue teaching."
+
+# Fire-and-forget tasks (e.g. starting the Twilio recording), referenced here so
+# they aren't garbage collected before completing.
+_background_tasks: set = set()
+
+SMART_TURN_PARAMS = SmartTurnParams(stop_secs=1.5, pre_speech_ms=0.0)
+
+# Smart Turn v3 analyzers whose ONNX session is already loaded. An analyzer
+# buffers per-call audio, so each call leases its own and clears it on return.
+_idle_turn_analyzers: list = []
+
+
+def prewarm_turn_analyzers(count: int = 1):
+    """Load Smart Turn analyzers ahead of time so calls don't wait on the model."""
+    for _ in range(count):
+        _idle_turn_analyzers.append(LocalSmartTurnAnalyzerV3(params=SMART_TURN_PARAMS))
+
+
+def _acquire_turn_analyzer():
+    if _idle_turn_analyzers:
+        return _idle_turn_analyzers.pop()
+    return LocalSmartTurnAnalyzerV3(params=SMART_TURN_PARAMS)
+
+
+def _release_turn_analyzer(turn_analyzer):
+    turn_analyzer.clear()
+    _idle_turn_analyzers.append(turn_analyzer)
+
 
 async def get_call_info(call_sid: str) -> dict:
     """Fetch call information from Twilio REST API using aiohttp."""
-    account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-    auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-
-    if not account_sid or not auth_token:
+    if _TWILIO_AUTH is None:
         logger.warning("Missing Twilio credentials, cannot fetch call info")
         return {}
 
-    url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Calls/{call_sid}.json"
+    url = CALL_URL_TEMPLATE.format(call_sid=call_sid)
 
     try:
-        auth = aiohttp.BasicAuth(account_sid, auth_token)
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, auth=auth) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Twilio API error ({response.status}): {error_text}")
-                    return {}
+        session = get_shared_session()
+        async with session.get(url, auth=_TWILIO_AUTH) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"Twilio API error ({response.status}): {error_text}")
+                return {}
 
-                data = await response.json()
+            data = orjson.loads(await response.read())
 
-                call_info = {
-                    "from_number": data.get("from"),
-                    "to_number": data.get("to"),
-                }
+            call_info = {
+                "from_number": data.get("from"),
+                "to_number": data.get("to"),
+            }
 
-                return call_info
+            return call_info
 
     except Exception as e:
         logger.error(f"Error fetching call info from Twilio: {e}")
@@ -88,31 +156,26 @@ async def get_call_info(call_sid: str) -> dict:
 
 async def start_twilio_recording(call_sid: str):
     """Start a Twilio-side recording for the given call via the REST API."""
-    account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-    auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-
-    if not account_sid or not auth_token:
+    if _TWILIO_AUTH is None:
         logger.warning("Missing Twilio credentials, cannot start recording")
         return
 
-    url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Calls/{call_sid}/Recordings.json"
+    url = REC_URL_TEMPLATE.format(call_sid=call_sid)
 
     try:
-        auth = aiohttp.BasicAuth(account_sid, auth_token)
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                auth=auth,
-                data={"RecordingChannels": "dual"},
-            ) as response:
-                if response.status not in (200, 201):
-                    error_text = await response.text()
-                    logger.error(f"Twilio recording API error ({response.status}): {error_text}")
-                    return
-
-                data = await response.json()
-                logger.info(f"Twilio recording started: SID={data.get('sid')}")
+        session = get_shared_session()
+        async with session.post(
+            url,
+            auth=_TWILIO_AUTH,
+            data={"RecordingChannels": "dual"},
+        ) as response:
+            if response.status not in (200, 201):
+                error_text = await response.text()
+                logger.error(f"Twilio recording API error ({response.status}): {error_text}")
+                return
+
+            data = orjson.loads(await response.read())
+            logger.info(f"Twilio recording started: SID={data.get('sid')}")
 
     except Exception as e:
         logger.error(f"Error starting Twilio recording: {e}")
@@ -141,100 +204,91 @@ async def run_bot(
     tools_schema = register_tools(
         llm,
         caller_number=caller_number,
-        account_sid=os.getenv("TWILIO_ACCOUNT_SID", ""),
-        auth_token=os.getenv("TWILIO_AUTH_TOKEN", ""),
+        account_sid=_ACCOUNT_SID,
+        auth_token=_AUTH_TOKEN,
         twilio_number=os.getenv("TWILIO_PHONE_NUMBER", ""),
     )
 
-    messages = [
-        {
-            "role": "system",
-            "content": (
-                "You are Miss Harper, an elementary school teacher in an audio call. "
-                "Your output will be converted to audio so don't include special characters in your answers. "
-                "You are an expert in answering questions about elementary school subjects like math, science, history, and literature. "
-                "If the student asks about math, just give the answer without explaining how you got it. "
-                "For other subjects, provide clear and concise explanations suitable for an elementary school student. "
-                "If the student is quiet for a while, you will continue teaching by asking them questions or providing "
-                "interesting facts related to the current topic. Always keep the conversation engaging and educational. "
-                "You are also a storyteller and if asked for a story, you will tell an interesting and age-appropriate story to the student. "
-                "\n\n"
-                "You have access to the following tools:\n"
-                "- You can check today's class schedule when students ask what's next or what subjects are planned for today.\n"
-                "- You can look up word definitions when students ask what a word means.\n"
-                "- You can send a lesson summary via text message when the student asks for one or when the lesson ends.\n"
-                "\n"
-                "Use these tools naturally in conversation. When you use a tool, incorporate the results into your spoken response."
+    messages = [dict(_SYSTEM_MSG)]
+
+    # Everything after the lease sits in the try so a setup failure still
+    # returns the analyzer (and its loaded ONNX session) to the pool.
+    turn_analyzer = _acquire_turn_analyzer()
+    try:
+        context = LLMContext(messages, tools=tools_schema)
+        user_aggregator, assistant_aggregator = LLMContextAggregatorPair(
+            context,
+            user_params=LLMUserAggregatorParams(
+                user_turn_strategies=UserTurnStrategies(
+                    start=[VADUserTurnStartStrategy(), TranscriptionUserTurnStartStrategy()],
+                    stop=[TurnAnalyzerUserTurnStopStrategy(turn_analyzer=turn_analyzer)],
+                ),
+                user_turn_stop_timeout=2.0,
+                user_idle_timeout=5.0,
             ),
-        },
-    ]
-
-    smart_turn_params = SmartTurnParams(stop_secs=1.5, pre_speech_ms=0.0)
-    turn_analyzer = LocalSmartTurnAnalyzerV3(params=smart_turn_params)
-
-    context = LLMContext(messages, tools=tools_schema)
-    user_aggregator, assistant_aggregator = LLMContextAggregatorPair(
-        context,
-        user_params=LLMUserAggregatorParams(
-            user_turn_strategies=UserTurnStrategies(
-                start=[VADUserTurnStartStrategy(), TranscriptionUserTurnStartStrategy()],
-                stop=[TurnAnalyzerUserTurnStopStrategy(turn_analyzer=turn_analyzer)],
+        )
+
+        pipeline = Pipeline(
+            [
+                transport.input(),  # Websocket input from client
+                stt,  # Speech-To-Text
+                user_aggregator,
+                llm,  # LLM (with function calling)
+                tts,  # Text-To-Speech
+                transport.output(),  # Websocket output to client
+                assistant_aggregator,
+            ]
+        )
+
+        task = PipelineTask(
+            pipeline,
+            params=PipelineParams(
+                audio_in_sample_rate=8000,
+                audio_out_sample_rate=8000,
+                enable_metrics=True,
+                enable_usage_metrics=True,
             ),
-            user_turn_stop_timeout=2.0,
-            user_idle_timeout=5.0,
-        ),
-    )
-
-    pipeline = Pipeline(
-        [
-            transport.input(),  # Websocket input from client
-            stt,  # Speech-To-Text
-            user_aggregator,
-            llm,  # LLM (with function calling)
-            tts,  # Text-To-Speech
-            transport.output(),  # Websocket output to client
-            assistant_aggregator,
-        ]
-    )
-
-    task = PipelineTask(
-        pipeline,
-        params=PipelineParams(
-            audio_in_sample_rate=8000,
-            audio_out_sample_rate=8000,
-            enable_metrics=True,
-            enable_usage_metrics=True,
-        ),
-        observers=[
-            MetricsLogObserver(),
-            UserBotLatencyLogObserver(),
-            LatencyBreakdownObserver(),
-        ],
-    )
-
-    @transport.event_handler("on_client_connected")
-    async def on_client_connected(transport, client):
-        # Start Twilio-level recording.
-        if call_sid:
-            await start_twilio_recording(call_sid)
-        # Kick off the conversation.
-        messages.append({"role": "system", "content": "Say hello and introduce yourself as Miss Harper."})
-        await task.queue_frames([LLMRunFrame()])
-
-    @user_aggregator.event_handler("on_user_turn_idle")
-    async def on_user_turn_idle(aggregator):
-        logger.info("User idle — prompting bot to continue")
-        messages.append({"role": "system", "content": "The student is quiet. Continue teaching."})
-        await task.queue_frames([LLMRunFrame()])
-
-    @transport.event_handler("on_client_disconnected")
-    async def on_client_disconnected(transport, client):
-        logger.info("Client disconnected")
-        await task.cancel()
-
-    runner = PipelineRunner(handle_sigint=handle_sigint, force_gc=True)
-
-    await runner.run(task)
+            observers=[
+                MetricsLogObserver(),
+                UserBotLatencyLogObserver(),
+                LatencyBreakdownObserver(),
+            ],
+        )
+
+        async def prompt(system_content: str):
+            """Append a system instruction and ask the LLM to respond to it."""
+            messages.append({"role": "system", "content": system_content})
+            # A fresh LLMRunFrame each time: frames carry a unique id, and pipecat
+            # (and our observers) treat a re-pushed instance as already seen.
+            await task.queue_frame(LLMRunFrame())
+
+        @transport.event_handler("on_client_connected")
+        async def on_client_connected(transport, client):
+            # Start Twilio-level recording in the background so the REST round-trip
+            # doesn't delay the greeting. The set keeps a strong reference until it
+            # finishes; start_twilio_recording logs its own errors.
+            if call_sid:
+                recording_task = asyncio.create_task(start_twilio_recording(call_sid))
+                _background_tasks.add(recording_task)
+                recording_task.add_done_callback(_background_tasks.discard)
+            # Kick off the conversation.
+            await prompt(_GREETING_PROMPT)
+
+        @user_aggregator.event_handler("on_user_turn_idle")
+        async def on_user_turn_idle(aggregator):
+            logger.info("User idle — prompting bot to continue")
+            await prompt(_IDLE_PROMPT)
+
+        @transport.event_handler("on_client_disconnected")
+        async def on_client_disconnected(transport, client):
+            logger.info("Client disconnected")
+            await task.cancel()
+
+        runner = PipelineRunner(handle_sigint=handle_sigint, force_gc=True)
+
+        await runner.run(task)
+    finally:
+        _release_turn_analyzer(turn_analyzer)
 
 
 async def bot(runner_args: RunnerArguments, testing: Optional[bool] = False):
@@ -251,8 +305,8 @@ async def bot(runner_args: RunnerArguments, testing: Optional[bool] = False):
     serializer = TwilioFrameSerializer(
         stream_sid=call_data["stream_id"],
         call_sid=call_data["call_id"],
-        account_sid=os.getenv("TWILIO_ACCOUNT_SID", ""),
-        auth_token=os.getenv("TWILIO_AUTH_TOKEN", ""),
+        account_sid=_ACCOUNT_SID,
+        auth_token=_AUTH_TOKEN,
     )
 
     transport = FastAPIWebsocketTransport(
@@ -0,0 +1,40 @@
+"""Shared aiohttp session for outbound HTTP calls (Twilio REST, Dictionary API).
+
+Creating a ClientSession per request forces a fresh TCP + TLS handshake every
+time. A single lazily-created session keeps connections alive across calls so
+warm requests reuse the pooled connection instead.
+"""
+
+from typing import Optional
+
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Return the process-wide ClientSession, creating it on first use.
+
+    Must be called from within a running event loop.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+    return _session
+
+
+async def close_shared_session():
+    """Close the shared ClientSession if one was created."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
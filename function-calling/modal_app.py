@@ -21,12 +21,25 @@ image = (
     .pip_install(
         "pipecat-ai[websocket,groq,silero,deepgram,rnnoise,runner,local-smart-turn-v3]>=0.0.99",
         "pipecatcloud>=0.2.18",
+        "orjson",
         "python-dotenv",
         "requests",
     )
+    # Pin NumPy/BLAS work (e.g. audio resampling and feature extraction) to one
+    # thread; the per-frame arrays are too small to gain from more. The ONNX
+    # models already run single-threaded via pipecat's SessionOptions.
+    .env(
+        {
+            "OMP_NUM_THREADS": "1",
+            "OPENBLAS_NUM_THREADS": "1",
+            "MKL_NUM_THREADS": "1",
+            "NUMEXPR_NUM_THREADS": "1",
+        }
+    )
     .run_commands("python -c 'from pyrnnoise import RNNoise; RNNoise(sample_rate=48000)'")
     .add_local_file("bot.py", "/root/bot.py")
     .add_local_file("tools.py", "/root/tools.py")
+    .add_local_file("http_session.py", "/root/http_session.py")
     .add_local_file("observers.py", "/root/observers.py")
 )
 
@@ -46,24 +59,38 @@ app = modal.App("twilio-function-calling-bot")
     secrets=[modal.Secret.from_dotenv(__file__)],
     scaledown_window=300,
     timeout=600,
-    keep_warm=0,
+    min_containers=1,
 )
 @modal.asgi_app()
 def serve():
-    import traceback
+    import functools
+    import sys
 
     from fastapi import FastAPI, Request, WebSocket
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import HTMLResponse
+    from fastapi.responses import Response
     from loguru import logger
 
+    # Keep tracebacks on failures but skip loguru's per-frame variable capture.
+    logger.remove()
+    logger.add(sys.stderr, backtrace=False, diagnose=False)
+
     # Eagerly import bot and pipecat modules at container init (not per-request)
     # so the WebSocket handler doesn't pay import cost when Twilio connects.
-    from bot import bot
+    from bot import bot, prewarm_turn_analyzers
+    from http_session import close_shared_session
     from pipecat.runner.types import WebSocketRunnerArguments
 
+    # Load a Smart Turn model at container init so the first call doesn't
+    # block on it.
+    prewarm_turn_analyzers()
+
     web_app = FastAPI()
 
+    # The aiohttp session is shared across calls for connection reuse; close it
+    # when the container shuts down.
+    web_app.add_event_handler("shutdown", close_shared_session)
+
     web_app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -76,23 +103,26 @@ def serve():
     async def health():
         return {"status": "ok"}
 
-    @web_app.post("/")
-    async def twiml(request: Request):
-        """Return TwiML XML instructing Twilio to open a WebSocket stream."""
-        host = request.headers.get("host", "")
-        ws_url = f"wss://{host}/ws"
-        logger.info(f"TwiML: directing Twilio stream to {ws_url}")
-
-        xml = (
+    @functools.lru_cache(maxsize=16)
+    def twiml_bytes(host: str) -> bytes:
+        """Build the TwiML body for a host once; it only varies by host."""
+        return (
             '<?xml version="1.0" encoding="UTF-8"?>'
             "<Response>"
             "<Connect>"
-            f'<Stream url="{ws_url}"></Stream>'
+            f'<Stream url="wss://{host}/ws"></Stream>'
             "</Connect>"
             '<Pause length="40"/>'
             "</Response>"
-        )
-        return HTMLResponse(content=xml, media_type="application/xml")
+        ).encode()
+
+    @web_app.post("/")
+    async def twiml(request: Request):
+        """Return TwiML XML instructing Twilio to open a WebSocket stream."""
+        host = request.headers.get("host", "")
+        logger.info(f"TwiML: directing Twilio stream to wss://{host}/ws")
+
+        return Response(content=twiml_bytes(host), media_type="application/xml")
 
     @web_app.websocket("/ws")
     async def websocket_endpoint(websocket: WebSocket):
@@ -103,8 +133,7 @@ def serve():
         try:
             runner_args = WebSocketRunnerArguments(websocket=websocket)
             await bot(runner_args)
-        except Exception as e:
-            logger.error(f"Error in bot pipeline: {type(e).__name__}: {e}")
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in bot pipeline")
 
     return web_app
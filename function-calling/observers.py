@@ -6,9 +6,9 @@
 #
 
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from statistics import mean
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from loguru import logger
 
@@ -29,8 +29,46 @@ from pipecat.metrics.metrics import (
 from pipecat.observers.base_observer import BaseObserver, FramePushed
 from pipecat.processors.frame_processor import FrameDirection
 
+# Number of recent frame ids remembered for de-duplication. A frame is only
+# re-observed while it hops between adjacent processors, so a small window is
+# enough and keeps memory flat over long calls.
+_SEEN_FRAME_IDS_MAX = 4096
 
-@dataclass
+# One summary-table row: turn, total, STT, Smart Turn, LLM, TTS, tokens, chars
+_ROW_FORMAT = " %3d | %s | %8s | %10s | %8s | %8s | %10s | %8s"
+
+
+def _classify_ttfb_processor(processor: str) -> Optional[str]:
+    """Map a metrics processor name to the TurnLatency TTFB field it feeds."""
+    proc = processor.lower()
+    if "stt" in proc:
+        return "stt_ttfb"
+    elif "llm" in proc:
+        return "llm_ttfb"
+    elif "tts" in proc:
+        return "tts_ttfb"
+    return None
+
+
+def _fmt_s(val: Optional[float]) -> str:
+    return f"{val:.3f}s" if val is not None else "   -  "
+
+
+def _fmt_ms(val: Optional[float]) -> str:
+    return f"{val:.0f}ms" if val is not None else "   -  "
+
+
+def _fmt_tokens(prompt: Optional[int], completion: Optional[int]) -> str:
+    if prompt is not None and completion is not None:
+        return f"{prompt}/{completion}"
+    return "-"
+
+
+def _fmt_int(val: Optional[int]) -> str:
+    return str(val) if val is not None else "-"
+
+
+@dataclass(slots=True)
 class TurnLatency:
     """Latency breakdown for a single conversation turn."""
 
@@ -62,67 +100,89 @@ class LatencyBreakdownObserver(BaseObserver):
         self._current_turn: Optional[TurnLatency] = None
         self._last_completed_turn: Optional[TurnLatency] = None
         self._completed_turns: List[TurnLatency] = []
-        self._seen_frame_ids: set = set()
+        self._seen_frame_ids: OrderedDict[int, None] = OrderedDict()
         self._pending_metrics: List[MetricsFrame] = []
+        # Processor names come from a handful of service instances, so classify
+        # each one once instead of lowercasing and substring-scanning per metric.
+        self._ttfb_field_by_processor: Dict[str, Optional[str]] = {}
+        # Exact-type dispatch table; pipecat frames are concrete classes, so a
+        # dict lookup replaces the isinstance chain on every observed frame.
+        self._dispatch = {
+            VADUserStartedSpeakingFrame: self._on_vad_start,
+            VADUserStoppedSpeakingFrame: self._on_vad_stop,
+            MetricsFrame: self._on_metrics,
+            BotStartedSpeakingFrame: self._on_bot_start,
+            EndFrame: self._on_end,
+            CancelFrame: self._on_end,
+        }
 
     async def on_push_frame(self, data: FramePushed) -> None:
-        if data.direction != FrameDirection.DOWNSTREAM:
+        # Upstream frames are roughly half of all pushes; bail out before
+        # touching anything else.
+        if data.direction is not FrameDirection.DOWNSTREAM:
             return
 
         # Skip already-processed frames (observers see each frame multiple times
         # as it passes between processors)
-        if data.frame.id in self._seen_frame_ids:
-            return
-        self._seen_frame_ids.add(data.frame.id)
-
+        seen = self._seen_frame_ids
         frame = data.frame
-
-        if isinstance(frame, VADUserStartedSpeakingFrame):
-            # User started speaking again — reset any pending timer
+        frame_id = frame.id
+        if frame_id in seen:
+            return
+        seen[frame_id] = None
+        if len(seen) > _SEEN_FRAME_IDS_MAX:
+            seen.popitem(last=False)
+
+        handler = self._dispatch.get(type(frame))
+        if handler:
+            handler(frame)
+
+    def _on_vad_start(self, frame: VADUserStartedSpeakingFrame) -> None:
+        # User started speaking again — reset any pending timer
+        self._user_stopped_time = 0.0
+
+    def _on_vad_stop(self, frame: VADUserStoppedSpeakingFrame) -> None:
+        self._user_stopped_time = time.time()
+        self._turn_count += 1
+        self._current_turn = TurnLatency(turn_number=self._turn_count)
+        self._last_completed_turn = None
+        # Flush metrics that arrived before the turn was created (e.g. STT TTFB)
+        for mf in self._pending_metrics:
+            self._apply_metrics(mf, self._current_turn)
+        self._pending_metrics.clear()
+
+    def _on_metrics(self, frame: MetricsFrame) -> None:
+        if self._current_turn:
+            self._apply_metrics(frame, self._current_turn)
+        elif self._last_completed_turn:
+            # Late-arriving metrics (e.g. LLM usage after BotStartedSpeaking)
+            self._apply_metrics(frame, self._last_completed_turn)
+        else:
+            # Buffer for the next turn (e.g. STT TTFB before VADUserStopped)
+            self._pending_metrics.append(frame)
+
+    def _on_bot_start(self, frame: BotStartedSpeakingFrame) -> None:
+        if self._user_stopped_time > 0 and self._current_turn:
+            self._current_turn.total_wall_clock = time.time() - self._user_stopped_time
+            self._completed_turns.append(self._current_turn)
+            self._last_completed_turn = self._current_turn
             self._user_stopped_time = 0.0
+            self._current_turn = None
 
-        elif isinstance(frame, VADUserStoppedSpeakingFrame):
-            self._user_stopped_time = time.time()
-            self._turn_count += 1
-            self._current_turn = TurnLatency(turn_number=self._turn_count)
-            self._last_completed_turn = None
-            # Flush metrics that arrived before the turn was created (e.g. STT TTFB)
-            for mf in self._pending_metrics:
-                self._apply_metrics(mf, self._current_turn)
-            self._pending_metrics.clear()
-
-        elif isinstance(frame, MetricsFrame):
-            if self._current_turn:
-                self._apply_metrics(frame, self._current_turn)
-            elif self._last_completed_turn:
-                # Late-arriving metrics (e.g. LLM usage after BotStartedSpeaking)
-                self._apply_metrics(frame, self._last_completed_turn)
-            else:
-                # Buffer for the next turn (e.g. STT TTFB before VADUserStopped)
-                self._pending_metrics.append(frame)
-
-        elif isinstance(frame, BotStartedSpeakingFrame):
-            if self._user_stopped_time > 0 and self._current_turn:
-                self._current_turn.total_wall_clock = time.time() - self._user_stopped_time
-                self._completed_turns.append(self._current_turn)
-                self._last_completed_turn = self._current_turn
-                self._user_stopped_time = 0.0
-                self._current_turn = None
-
-        elif isinstance(frame, (EndFrame, CancelFrame)):
-            self._print_summary()
+    def _on_end(self, frame) -> None:
+        self._print_summary()
 
     def _apply_metrics(self, frame: MetricsFrame, turn: TurnLatency) -> None:
         """Route metrics data to the correct field on the given turn."""
         for m in frame.data:
             if isinstance(m, TTFBMetricsData):
-                proc = m.processor.lower()
-                if "stt" in proc:
-                    turn.stt_ttfb = m.value
-                elif "llm" in proc:
-                    turn.llm_ttfb = m.value
-                elif "tts" in proc:
-                    turn.tts_ttfb = m.value
+                try:
+                    field_name = self._ttfb_field_by_processor[m.processor]
+                except KeyError:
+                    field_name = _classify_ttfb_processor(m.processor)
+                    self._ttfb_field_by_processor[m.processor] = field_name
+                if field_name:
+                    setattr(turn, field_name, m.value)
             elif isinstance(m, SmartTurnMetricsData) and m.is_complete:
                 turn.smart_turn_e2e_ms = m.e2e_processing_time_ms
             elif isinstance(m, LLMUsageMetricsData):
@@ -147,52 +207,56 @@ class LatencyBreakdownObserver(BaseObserver):
             sep,
         ]
 
+        # Running (sum, count) per averaged column, accumulated alongside the
+        # per-turn rows: total, STT TTFB, Smart Turn, LLM TTFB, TTS TTFB.
+        sums = [0.0] * 5
+        counts = [0] * 5
+
+        # Bind formatters locally and use one precomputed %-format for the rows
+        row_fmt = _ROW_FORMAT
+        fmt_s = _fmt_s
+        fmt_ms = _fmt_ms
+        fmt_tokens = _fmt_tokens
+        fmt_int = _fmt_int
+
         for t in turns:
+            for i, v in enumerate(
+                (t.total_wall_clock, t.stt_ttfb, t.smart_turn_e2e_ms, t.llm_ttfb, t.tts_ttfb)
+            ):
+                if v is not None:
+                    sums[i] += v
+                    counts[i] += 1
+
             lines.append(
-                f" {t.turn_number:>3} "
-                f"| {self._fmt_s(t.total_wall_clock)} "
-                f"| {self._fmt_s(t.stt_ttfb):>8} "
-                f"| {self._fmt_ms(t.smart_turn_e2e_ms):>10} "
-                f"| {self._fmt_s(t.llm_ttfb):>8} "
-                f"| {self._fmt_s(t.tts_ttfb):>8} "
-                f"| {self._fmt_tokens(t.llm_prompt_tokens, t.llm_completion_tokens):>10} "
-                f"| {self._fmt_int(t.tts_characters):>8}"
+                row_fmt
+                % (
+                    t.turn_number,
+                    fmt_s(t.total_wall_clock),
+                    fmt_s(t.stt_ttfb),
+                    fmt_ms(t.smart_turn_e2e_ms),
+                    fmt_s(t.llm_ttfb),
+                    fmt_s(t.tts_ttfb),
+                    fmt_tokens(t.llm_prompt_tokens, t.llm_completion_tokens),
+                    fmt_int(t.tts_characters),
+                )
             )
 
         lines.append(sep)
 
         # Averages row
-        def avg_or_none(vals):
-            filtered = [v for v in vals if v is not None]
-            return mean(filtered) if filtered else None
+        avg_total, avg_stt, avg_smart_turn, avg_llm, avg_tts = (
+            total / count if count else None for total, count in zip(sums, counts)
+        )
 
         lines.append(
             f" {'Avg':>3} "
-            f"| {self._fmt_s(avg_or_none([t.total_wall_clock for t in turns]))} "
-            f"| {self._fmt_s(avg_or_none([t.stt_ttfb for t in turns])):>8} "
-            f"| {self._fmt_ms(avg_or_none([t.smart_turn_e2e_ms for t in turns])):>10} "
-            f"| {self._fmt_s(avg_or_none([t.llm_ttfb for t in turns])):>8} "
-            f"| {self._fmt_s(avg_or_none([t.tts_ttfb for t in turns])):>8} "
+            f"| {fmt_s(avg_total)} "
+            f"| {fmt_s(avg_stt):>8} "
+            f"| {fmt_ms(avg_smart_turn):>10} "
+            f"| {fmt_s(avg_llm):>8} "
+            f"| {fmt_s(avg_tts):>8} "
             f"|            "
             f"|         "
         )
 
         logger.info("\n".join(lines))
-
-    @staticmethod
-    def _fmt_s(val: Optional[float]) -> str:
-        return f"{val:.3f}s" if val is not None else "   -  "
-
-    @staticmethod
-    def _fmt_ms(val: Optional[float]) -> str:
-        return f"{val:.0f}ms" if val is not None else "   -  "
-
-    @staticmethod
-    def _fmt_tokens(prompt: Optional[int], completion: Optional[int]) -> str:
-        if prompt is not None and completion is not None:
-            return f"{prompt}/{completion}"
-        return "-"
-
-    @staticmethod
-    def _fmt_int(val: Optional[int]) -> str:
-        return str(val) if val is not None else "-"
@@ -7,11 +7,25 @@ Three tools demonstrating different patterns:
 """
 
 import aiohttp
+import orjson
 from loguru import logger
 from pipecat.adapters.schemas.function_schema import FunctionSchema
 from pipecat.adapters.schemas.tools_schema import ToolsSchema
+from pipecat.frames.frames import TTSSpeakFrame
 from pipecat.services.llm_service import FunctionCallParams
 
+from http_session import get_shared_session
+
+# Mock schedule data, shared across calls rather than rebuilt per tool call.
+_SCHEDULE = (
+    {"time": "9:00 AM", "subject": "Math", "topic": "Multiplication tables"},
+    {"time": "10:00 AM", "subject": "Science", "topic": "The water cycle"},
+    {"time": "11:00 AM", "subject": "Reading", "topic": "Charlotte's Web chapter 5"},
+    {"time": "12:00 PM", "subject": "Lunch break"},
+    {"time": "1:00 PM", "subject": "History", "topic": "Ancient Egypt"},
+    {"time": "2:00 PM", "subject": "Art", "topic": "Watercolor painting"},
+)
+
 
 def register_tools(
     llm,
@@ -26,21 +40,17 @@ def register_tools(
     so tool functions are self-contained without global state.
     """
 
+    # Built once per call rather than on every send_lesson_summary invocation.
+    twilio_auth = aiohttp.BasicAuth(account_sid, auth_token)
+    messages_url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
+
     # Use the deprecated 6-parameter style for get_class_schedule.
     # Groq sends arguments=null for parameter-free tools; pipecat's
     # DirectFunctionWrapper does **args which crashes on None. The deprecated
     # 6-param style calls the handler with positional args — no **args involved.
     async def get_class_schedule(function_name, tool_call_id, arguments, llm, context, result_callback):
         logger.info("Tool called: get_class_schedule")
-        schedule = [
-            {"time": "9:00 AM", "subject": "Math", "topic": "Multiplication tables"},
-            {"time": "10:00 AM", "subject": "Science", "topic": "The water cycle"},
-            {"time": "11:00 AM", "subject": "Reading", "topic": "Charlotte's Web chapter 5"},
-            {"time": "12:00 PM", "subject": "Lunch break"},
-            {"time": "1:00 PM", "subject": "History", "topic": "Ancient Egypt"},
-            {"time": "2:00 PM", "subject": "Art", "topic": "Watercolor painting"},
-        ]
-        await result_callback(schedule)
+        await result_callback(_SCHEDULE)
 
     async def lookup_word(params: FunctionCallParams, word: str):
         """Look up the definition of a word in the dictionary.
@@ -49,18 +59,21 @@ def register_tools(
             word: The word to look up
         """
         logger.info(f"Tool called: lookup_word(word={word!r})")
+        # Speak a short filler while the dictionary request is in flight so the
+        # caller doesn't hear silence for the whole round-trip.
+        await params.llm.push_frame(TTSSpeakFrame("Let me look that up."))
         url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        meaning = data[0]["meanings"][0]
-                        definition = meaning["definitions"][0]["definition"]
-                        part_of_speech = meaning["partOfSpeech"]
-                        result = f"{word} ({part_of_speech}): {definition}"
-                    else:
-                        result = f"Sorry, I couldn't find the word '{word}' in the dictionary."
+            session = get_shared_session()
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    data = orjson.loads(await resp.read())
+                    meaning = data[0]["meanings"][0]
+                    definition = meaning["definitions"][0]["definition"]
+                    part_of_speech = meaning["partOfSpeech"]
+                    result = f"{word} ({part_of_speech}): {definition}"
+                else:
+                    result = f"Sorry, I couldn't find the word '{word}' in the dictionary."
         except Exception as e:
             logger.error(f"Dictionary API error: {e}")
             result = f"Sorry, there was an error looking up the word '{word}'."
@@ -86,10 +99,7 @@ def register_tools(
             )
             return
 
-        url = (
-            f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
-        )
-        auth = aiohttp.BasicAuth(account_sid, auth_token)
+        await params.llm.push_frame(TTSSpeakFrame("One moment while I send that."))
         data = {
             "From": twilio_number,
             "To": caller_number,
@@ -97,20 +107,20 @@ def register_tools(
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, auth=auth, data=data) as resp:
-                    if resp.status == 201:
-                        resp_data = await resp.json()
-                        logger.info(f"SMS sent: SID={resp_data.get('sid')}")
-                        await params.result_callback(
-                            "I've sent the lesson summary to your phone!"
-                        )
-                    else:
-                        error_text = await resp.text()
-                        logger.error(f"Twilio SMS error ({resp.status}): {error_text}")
-                        await params.result_callback(
-                            "Sorry, I wasn't able to send the text message."
-                        )
+            session = get_shared_session()
+            async with session.post(messages_url, auth=twilio_auth, data=data) as resp:
+                if resp.status == 201:
+                    resp_data = orjson.loads(await resp.read())
+                    logger.info(f"SMS sent: SID={resp_data.get('sid')}")
+                    await params.result_callback(
+                        "I've sent the lesson summary to your phone!"
+                    )
+                else:
+                    error_text = await resp.text()
+                    logger.error(f"Twilio SMS error ({resp.status}): {error_text}")
+                    await params.result_callback(
+                        "Sorry, I wasn't able to send the text message."
+                    )
         except Exception as e:
             logger.error(f"Error sending SMS: {e}")
             await params.result_callback(
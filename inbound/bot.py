@@ -4,17 +4,21 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import asyncio
+import gc
 import os
+from collections import deque
 from typing import Optional
 
 import aiohttp
+import orjson
 from deepgram import LiveOptions
 from dotenv import load_dotenv
 from loguru import logger
 from pipecat.audio.filters.rnnoise_filter import RNNoiseFilter
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.frames.frames import LLMRunFrame
+from pipecat.frames.frames import Frame, LLMContextFrame, LLMRunFrame
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
@@ -23,6 +27,7 @@ from pipecat.processors.aggregators.llm_response_universal import (
     LLMContextAggregatorPair,
     LLMUserAggregatorParams,
 )
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
 from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
 from pipecat.turns.user_start import VADUserTurnStartStrategy, TranscriptionUserTurnStartStrategy
@@ -45,6 +50,98 @@ load_dotenv(override=True)
 # Reduce logging noise from empty audio frame warnings
 logger.disable("pipecat.services.stt_service")
 
+# Raise the gen-0 GC threshold so collections rarely fire during live audio;
+# PipelineRunner(force_gc=True) still does a full collection once a call ends.
+gc.set_threshold(50_000, 20, 20)
+
+# Only the most recent system nudges (greeting, idle prompts) stay in the LLM
+# context, so a long, quiet call doesn't keep growing the prompt.
+MAX_SYSTEM_NUDGES = 3
+
+# Conversation history kept in the prompt on top of the base system prompt: the
+# last 20 user/assistant exchanges, further cut to a rough token budget.
+MAX_HISTORY_MESSAGES = 40
+MAX_PROMPT_TOKENS = 1500
+
+
+def _estimate_tokens(message) -> int:
+    # ~4 characters per token, plus a few tokens of per-message overhead.
+    content = message.get("content") if isinstance(message, dict) else None
+    return len(str(content or "")) // 4 + 4
+
+
+def trim_context(context: LLMContext):
+    """Drop the oldest history so the prompt stays within the limits above.
+
+    The first message (the base system prompt) is always kept.
+    """
+    messages = context.messages
+    if not messages:
+        return
+    base, history = messages[0], messages[1:][-MAX_HISTORY_MESSAGES:]
+    budget = MAX_PROMPT_TOKENS - _estimate_tokens(base)
+    tokens = sum(_estimate_tokens(m) for m in history)
+    start = 0
+    while tokens > budget and start < len(history) - 1:
+        tokens -= _estimate_tokens(history[start])
+        start += 1
+    if start or len(history) < len(messages) - 1:
+        context.set_messages([base, *history[start:]])
+
+
+class ContextWindow(FrameProcessor):
+    """Trims the LLM context before every completion request."""
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, LLMContextFrame):
+            trim_context(frame.context)
+        await self.push_frame(frame, direction)
+
+
+# One aiohttp session (and Twilio auth object) reused across calls, so the
+# Twilio REST requests on connect don't each pay a fresh TCP + TLS handshake.
+_session: Optional[aiohttp.ClientSession] = None
+_twilio_auth: Optional[aiohttp.BasicAuth] = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+    return _session
+
+
+def _get_twilio_auth() -> Optional[aiohttp.BasicAuth]:
+    global _twilio_auth
+    if _twilio_auth is None:
+        account_sid = os.getenv("TWILIO_ACCOUNT_SID")
+        auth_token = os.getenv("TWILIO_AUTH_TOKEN")
+        if account_sid and auth_token:
+            _twilio_auth = aiohttp.BasicAuth(account_sid, auth_token)
+    return _twilio_auth
+
+
+async def close_http_session():
+    """Close the shared aiohttp session (called on server shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+# before they finish.
+_background_tasks: set = set()
+
+
+def _on_background_task_done(task: asyncio.Task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Background task failed: {task.exception()}")
+
 
 async def get_call_info(call_sid: str) -> dict:
     """Fetch call information from Twilio REST API using aiohttp.
@@ -55,34 +152,31 @@ async def get_call_info(call_sid: str) -> dict:
     Returns:
         Dictionary containing call information including from_number, to_number, status, etc.
     """
-    account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-    auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-
-    if not account_sid or not auth_token:
+    auth = _get_twilio_auth()
+    if auth is None:
         logger.warning("Missing Twilio credentials, cannot fetch call info")
         return {}
 
-    url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Calls/{call_sid}.json"
+    url = f"https://api.twilio.com/2010-04-01/Accounts/{auth.login}/Calls/{call_sid}.json"
 
     try:
-        # Use HTTP Basic Auth with aiohttp
-        auth = aiohttp.BasicAuth(account_sid, auth_token)
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, auth=auth) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Twilio API error ({response.status}): {error_text}")
-                    return {}
+        session = await _get_session()
+        async with session.get(url, auth=auth) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"Twilio API error ({response.status}): {error_text}")
+                return {}
 
-                data = await response.json()
+            # Twilio's Call resource is large; orjson parses the raw body much
+            # faster than aiohttp's response.json() when we only need two fields.
+            data = orjson.loads(await response.read())
 
-                call_info = {
-                    "from_number": data.get("from"),
-                    "to_number": data.get("to"),
-                }
+            call_info = {
+                "from_number": data.get("from"),
+                "to_number": data.get("to"),
+            }
 
-                return call_info
+            return call_info
 
     except Exception as e:
         logger.error(f"Error fetching call info from Twilio: {e}")
@@ -94,31 +188,27 @@ async def start_twilio_recording(call_sid: str):
 
     Recordings are stored in your Twilio account and accessible via the console or API.
     """
-    account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-    auth_token = os.getenv("TWILIO_AUTH_TOKEN")
-
-    if not account_sid or not auth_token:
+    auth = _get_twilio_auth()
+    if auth is None:
         logger.warning("Missing Twilio credentials, cannot start recording")
         return
 
-    url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Calls/{call_sid}/Recordings.json"
+    url = f"https://api.twilio.com/2010-04-01/Accounts/{auth.login}/Calls/{call_sid}/Recordings.json"
 
     try:
-        auth = aiohttp.BasicAuth(account_sid, auth_token)
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                auth=auth,
-                data={"RecordingChannels": "dual"},
-            ) as response:
-                if response.status not in (200, 201):
-                    error_text = await response.text()
-                    logger.error(f"Twilio recording API error ({response.status}): {error_text}")
-                    return
-
-                data = await response.json()
-                logger.info(f"Twilio recording started: SID={data.get('sid')}")
+        session = await _get_session()
+        async with session.post(
+            url,
+            auth=auth,
+            data={"RecordingChannels": "dual"},
+        ) as response:
+            if response.status not in (200, 201):
+                error_text = await response.text()
+                logger.error(f"Twilio recording API error ({response.status}): {error_text}")
+                return
+
+            data = orjson.loads(await response.read())
+            logger.info(f"Twilio recording started: SID={data.get('sid')}")
 
     except Exception as e:
         logger.error(f"Error starting Twilio recording: {e}")
@@ -174,6 +264,7 @@ async def run_bot(transport: BaseTransport, handle_sigint: bool, testing: bool,
             transport.input(),  # Websocket input from client
             stt,  # Speech-To-Text
             user_aggregator,
+            ContextWindow(),  # Bound prompt growth on long calls
             llm,  # LLM
             tts,  # Text-To-Speech
             transport.output(),  # Websocket output to client
@@ -191,20 +282,33 @@ async def run_bot(transport: BaseTransport, handle_sigint: bool, testing: bool,
         ),
     )
 
+    system_nudges = deque(maxlen=MAX_SYSTEM_NUDGES)
+
+    async def nudge(content: str):
+        """Add a system nudge to the context and prompt the LLM to respond."""
+        if len(system_nudges) == system_nudges.maxlen:
+            oldest = system_nudges[0]
+            context.set_messages([m for m in context.messages if m is not oldest])
+        message = {"role": "system", "content": content}
+        system_nudges.append(message)
+        context.add_message(message)
+        await task.queue_frames([LLMRunFrame()])
+
     @transport.event_handler("on_client_connected")
     async def on_client_connected(transport, client):
-        # Start Twilio-level recording.
+        # Start Twilio-level recording in the background so the REST round-trip
+        # doesn't hold up the greeting.
         if call_sid:
-            await start_twilio_recording(call_sid)
+            recording_task = asyncio.create_task(start_twilio_recording(call_sid))
+            _background_tasks.add(recording_task)
+            recording_task.add_done_callback(_on_background_task_done)
         # Kick off the conversation.
-        messages.append({"role": "system", "content": "Say hello and introduce yourself as Miss Harper."})
-        await task.queue_frames([LLMRunFrame()])
+        await nudge("Say hello and introduce yourself as Miss Harper.")
 
     @user_aggregator.event_handler("on_user_turn_idle")
     async def on_user_turn_idle(aggregator):
         logger.info("User idle — prompting bot to continue")
-        messages.append({"role": "system", "content": "The student is quiet. Continue teaching."})
-        await task.queue_frames([LLMRunFrame()])
+        await nudge("The student is quiet. Continue teaching.")
 
     @transport.event_handler("on_client_disconnected")
     async def on_client_disconnected(transport, client):
@@ -225,10 +329,18 @@ async def bot(runner_args: RunnerArguments, testing: Optional[bool] = False):
 
     _, call_data = await parse_telephony_websocket(runner_args.websocket)
 
-    # Fetch call information from Twilio REST API
-    # With the call information, you can make a request to your API to get the user's information
-    # and inject that information into your bot's configuration.
-    call_info = await get_call_info(call_data["call_id"])
+    # Call information arrives as stream parameters from the Modal TwiML.
+    # Fall back to the Twilio REST API when they are absent (e.g. the local
+    # runner's TwiML). With the call information, you can make a request to your
+    # API to get the user's information and inject it into your bot's configuration.
+    body_data = call_data.get("body", {})
+    if body_data.get("from_number"):
+        call_info = {
+            "from_number": body_data.get("from_number"),
+            "to_number": body_data.get("to_number"),
+        }
+    else:
+        call_info = await get_call_info(call_data["call_id"])
     if call_info:
         logger.info(f"Call from: {call_info.get('from_number')} to: {call_info.get('to_number')}")
 
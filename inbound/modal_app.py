@@ -21,6 +21,7 @@ image = (
     .pip_install(
         "pipecat-ai[websocket,groq,silero,deepgram,rnnoise,runner,local-smart-turn-v3]>=0.0.99",
         "pipecatcloud>=0.2.18",
+        "orjson",
         "python-dotenv",
         "requests",
     )
@@ -34,6 +35,21 @@ image = (
 
 app = modal.App("twilio-inbound-bot")
 
+# TwiML returned to Twilio for each call; only the stream URL and phone numbers
+# vary. Values are passed through quoteattr, which supplies the surrounding quotes.
+_TWIML_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<Response>"
+    "<Connect>"
+    "<Stream url={ws_url}>"
+    '<Parameter name="to_number" value={to}/>'
+    '<Parameter name="from_number" value={frm}/>'
+    "</Stream>"
+    "</Connect>"
+    '<Pause length="40"/>'
+    "</Response>"
+)
+
 # ---------------------------------------------------------------------------
 # ASGI entrypoint
 # ---------------------------------------------------------------------------
@@ -48,20 +64,28 @@ app = modal.App("twilio-inbound-bot")
 )
 @modal.asgi_app()
 def serve():
-    import traceback
+    import sys
+    from xml.sax.saxutils import quoteattr
 
     from fastapi import FastAPI, Request, WebSocket
     from fastapi.middleware.cors import CORSMiddleware
     from fastapi.responses import HTMLResponse
     from loguru import logger
 
+    # Keep tracebacks on failures but skip loguru's per-frame variable capture.
+    logger.remove()
+    logger.add(sys.stderr, backtrace=False, diagnose=False)
+
     # Eagerly import bot and pipecat modules at container init (not per-request)
     # so the WebSocket handler doesn't pay import cost when Twilio connects.
-    from bot import bot
+    from bot import bot, close_http_session
     from pipecat.runner.types import WebSocketRunnerArguments
 
     web_app = FastAPI()
 
+    # bot.py shares one aiohttp session across calls; close it on shutdown.
+    web_app.add_event_handler("shutdown", close_http_session)
+
     web_app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -76,19 +100,21 @@ def serve():
 
     @web_app.post("/")
     async def twiml(request: Request):
-        """Return TwiML XML instructing Twilio to open a WebSocket stream."""
+        """Return TwiML XML instructing Twilio to open a WebSocket stream.
+
+        The caller/callee numbers from Twilio's webhook form are forwarded as
+        stream parameters so the bot doesn't need a REST lookup to get them.
+        """
+        form_data = await request.form()
+        to_number = form_data.get("To", "")
+        from_number = form_data.get("From", "")
+
         host = request.headers.get("host", "")
         ws_url = f"wss://{host}/ws"
         logger.info(f"TwiML: directing Twilio stream to {ws_url}")
 
-        xml = (
-            '<?xml version="1.0" encoding="UTF-8"?>'
-            "<Response>"
-            "<Connect>"
-            f'<Stream url="{ws_url}"></Stream>'
-            "</Connect>"
-            '<Pause length="40"/>'
-            "</Response>"
+        xml = _TWIML_TEMPLATE.format(
+            ws_url=quoteattr(ws_url), to=quoteattr(to_number), frm=quoteattr(from_number)
         )
         return HTMLResponse(content=xml, media_type="application/xml")
 
@@ -101,8 +127,7 @@ def serve():
         try:
             runner_args = WebSocketRunnerArguments(websocket=websocket)
             await bot(runner_args)
-        except Exception as e:
-            logger.error(f"Error in bot pipeline: {type(e).__name__}: {e}")
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in bot pipeline")
 
     return web_app
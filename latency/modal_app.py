@@ -49,13 +49,17 @@ app = modal.App("twilio-latency-bot")
 )
 @modal.asgi_app()
 def serve():
-    import traceback
+    import sys
 
     from fastapi import FastAPI, Request, WebSocket
     from fastapi.middleware.cors import CORSMiddleware
     from fastapi.responses import HTMLResponse
     from loguru import logger
 
+    # Keep tracebacks on failures but skip loguru's per-frame variable capture.
+    logger.remove()
+    logger.add(sys.stderr, backtrace=False, diagnose=False)
+
     # Eagerly import bot and pipecat modules at container init (not per-request)
     # so the WebSocket handler doesn't pay import cost when Twilio connects.
     from bot import bot
@@ -102,8 +106,7 @@ def serve():
         try:
             runner_args = WebSocketRunnerArguments(websocket=websocket)
             await bot(runner_args)
-        except Exception as e:
-            logger.error(f"Error in bot pipeline: {type(e).__name__}: {e}")
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in bot pipeline")
 
     return web_app
@@ -4,7 +4,9 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import gc
 import os
+from collections import deque
 
 import aiohttp
 from deepgram import LiveOptions
@@ -15,7 +17,7 @@ from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
 from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.frames.frames import LLMRunFrame
+from pipecat.frames.frames import Frame, LLMContextFrame, LLMRunFrame
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
@@ -24,6 +26,7 @@ from pipecat.processors.aggregators.llm_response_universal import (
     LLMContextAggregatorPair,
     LLMUserAggregatorParams,
 )
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.runner.types import RunnerArguments
 from pipecat.runner.utils import parse_telephony_websocket
 from pipecat.serializers.twilio import TwilioFrameSerializer
@@ -44,6 +47,78 @@ load_dotenv(override=True)
 # Reduce logging noise from empty audio frame warnings
 logger.disable("pipecat.services.stt_service")
 
+# Raise the gen-0 GC threshold so collections rarely fire during live audio;
+# PipelineRunner(force_gc=True) still does a full collection once a call ends.
+gc.set_threshold(50_000, 20, 20)
+
+SMART_TURN_PARAMS = SmartTurnParams(stop_secs=1.5, pre_speech_ms=0.0)
+
+# Only the most recent system nudges (greeting, idle prompts) stay in the LLM
+# context, so a long, quiet call doesn't keep growing the prompt.
+MAX_SYSTEM_NUDGES = 3
+
+# Conversation history kept in the prompt on top of the base system prompt: the
+# last 20 user/assistant exchanges, further cut to a rough token budget.
+MAX_HISTORY_MESSAGES = 40
+MAX_PROMPT_TOKENS = 1500
+
+
+def _estimate_tokens(message) -> int:
+    # ~4 characters per token, plus a few tokens of per-message overhead.
+    content = message.get("content") if isinstance(message, dict) else None
+    return len(str(content or "")) // 4 + 4
+
+
+def trim_context(context: LLMContext):
+    """Drop the oldest history so the prompt stays within the limits above.
+
+    The first message (the base system prompt) is always kept.
+    """
+    messages = context.messages
+    if not messages:
+        return
+    base, history = messages[0], messages[1:][-MAX_HISTORY_MESSAGES:]
+    budget = MAX_PROMPT_TOKENS - _estimate_tokens(base)
+    tokens = sum(_estimate_tokens(m) for m in history)
+    start = 0
+    while tokens > budget and start < len(history) - 1:
+        tokens -= _estimate_tokens(history[start])
+        start += 1
+    if start or len(history) < len(messages) - 1:
+        context.set_messages([base, *history[start:]])
+
+
+class ContextWindow(FrameProcessor):
+    """Trims the LLM context before every completion request."""
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, LLMContextFrame):
+            trim_context(frame.context)
+        await self.push_frame(frame, direction)
+
+
+# Smart Turn v3 analyzers whose ONNX session is already loaded. An analyzer
+# buffers per-call audio, so each call leases its own and clears it on return.
+_idle_turn_analyzers: list = []
+
+
+def prewarm_turn_analyzers(count: int = 1):
+    """Load Smart Turn analyzers ahead of time so calls don't wait on the model."""
+    for _ in range(count):
+        _idle_turn_analyzers.append(LocalSmartTurnAnalyzerV3(params=SMART_TURN_PARAMS))
+
+
+def _acquire_turn_analyzer():
+    if _idle_turn_analyzers:
+        return _idle_turn_analyzers.pop()
+    return LocalSmartTurnAnalyzerV3(params=SMART_TURN_PARAMS)
+
+
+def _release_turn_analyzer(turn_analyzer):
+    turn_analyzer.clear()
+    _idle_turn_analyzers.append(turn_analyzer)
+
 
 async def start_twilio_recording(call_sid: str):
     """Start a Twilio-side recording for the given call via the REST API.
@@ -80,7 +155,12 @@ async def start_twilio_recording(call_sid: str):
         logger.error(f"Error starting Twilio recording: {e}")
 
 
-async def run_bot(transport: BaseTransport, handle_sigint: bool, call_sid: str = ""):
+async def run_bot(
+    transport: BaseTransport,
+    handle_sigint: bool,
+    call_sid: str = "",
+    record: bool = True,
+):
     llm = GroqLLMService(api_key=os.getenv("GROQ_API_KEY"))
 
     stt = DeepgramSTTService(
@@ -104,67 +184,81 @@ async def run_bot(transport: BaseTransport, handle_sigint: bool, call_sid: str =
         },
     ]
 
-    smart_turn_params = SmartTurnParams(stop_secs=1.5, pre_speech_ms=0.0)
-    turn_analyzer = LocalSmartTurnAnalyzerV3(params=smart_turn_params)
-
-    context = LLMContext(messages)
-    user_aggregator, assistant_aggregator = LLMContextAggregatorPair(
-        context,
-        user_params=LLMUserAggregatorParams(
-            user_turn_strategies=UserTurnStrategies(
-                start=[VADUserTurnStartStrategy(), TranscriptionUserTurnStartStrategy()],
-                stop=[TurnAnalyzerUserTurnStopStrategy(turn_analyzer=turn_analyzer)],
+    # Everything after the lease sits in the try so a setup failure still
+    # returns the analyzer (and its loaded ONNX session) to the pool.
+    turn_analyzer = _acquire_turn_analyzer()
+    try:
+        context = LLMContext(messages)
+        user_aggregator, assistant_aggregator = LLMContextAggregatorPair(
+            context,
+            user_params=LLMUserAggregatorParams(
+                user_turn_strategies=UserTurnStrategies(
+                    start=[VADUserTurnStartStrategy(), TranscriptionUserTurnStartStrategy()],
+                    stop=[TurnAnalyzerUserTurnStopStrategy(turn_analyzer=turn_analyzer)],
+                ),
+                user_turn_stop_timeout=2.0,
+                user_idle_timeout=5.0,
             ),
-            user_turn_stop_timeout=2.0,
-            user_idle_timeout=5.0,
-        ),
-    )
+        )
+
+        pipeline = Pipeline(
+            [
+                transport.input(),  # Websocket input from client
+                stt,  # Speech-To-Text
+                user_aggregator,
+                ContextWindow(),  # Bound prompt growth on long calls
+                llm,  # LLM
+                tts,  # Text-To-Speech
+                transport.output(),  # Websocket output to client
+                assistant_aggregator,
+            ]
+        )
+
+        task = PipelineTask(
+            pipeline,
+            params=PipelineParams(
+                audio_in_sample_rate=8000,
+                audio_out_sample_rate=8000,
+                enable_metrics=True,
+                enable_usage_metrics=True,
+            ),
+        )
 
-    pipeline = Pipeline(
-        [
-            transport.input(),  # Websocket input from client
-            stt,  # Speech-To-Text
-            user_aggregator,
-            llm,  # LLM
-            tts,  # Text-To-Speech
-            transport.output(),  # Websocket output to client
-            assistant_aggregator,
-        ]
-    )
+        system_nudges = deque(maxlen=MAX_SYSTEM_NUDGES)
 
-    task = PipelineTask(
-        pipeline,
-        params=PipelineParams(
-            audio_in_sample_rate=8000,
-            audio_out_sample_rate=8000,
-            enable_metrics=True,
-            enable_usage_metrics=True,
-        ),
-    )
+        async def nudge(content: str):
+            """Add a system nudge to the context and prompt the LLM to respond."""
+            if len(system_nudges) == system_nudges.maxlen:
+                oldest = system_nudges[0]
+                context.set_messages([m for m in context.messages if m is not oldest])
+            message = {"role": "system", "content": content}
+            system_nudges.append(message)
+            context.add_message(message)
+            await task.queue_frames([LLMRunFrame()])
 
-    @transport.event_handler("on_client_connected")
-    async def on_client_connected(transport, client):
-        # Start Twilio-level recording.
-        if call_sid:
-            await start_twilio_recording(call_sid)
-        # Kick off the outbound conversation.
-        messages.append({"role": "system", "content": "Greet the person and introduce yourself."})
-        await task.queue_frames([LLMRunFrame()])
+        @transport.event_handler("on_client_connected")
+        async def on_client_connected(transport, client):
+            # Start Twilio-level recording, unless this call opted out (e.g. test calls).
+            if call_sid and record:
+                await start_twilio_recording(call_sid)
+            # Kick off the outbound conversation.
+            await nudge("Greet the person and introduce yourself.")
 
-    @user_aggregator.event_handler("on_user_turn_idle")
-    async def on_user_turn_idle(aggregator):
-        logger.info("User idle — prompting bot to continue")
-        messages.append({"role": "system", "content": "The person is quiet. Continue the conversation."})
-        await task.queue_frames([LLMRunFrame()])
+        @user_aggregator.event_handler("on_user_turn_idle")
+        async def on_user_turn_idle(aggregator):
+            logger.info("User idle — prompting bot to continue")
+            await nudge("The person is quiet. Continue the conversation.")
 
-    @transport.event_handler("on_client_disconnected")
-    async def on_client_disconnected(transport, client):
-        logger.info("Client disconnected")
-        await task.cancel()
+        @transport.event_handler("on_client_disconnected")
+        async def on_client_disconnected(transport, client):
+            logger.info("Client disconnected")
+            await task.cancel()
 
-    runner = PipelineRunner(handle_sigint=handle_sigint, force_gc=True)
+        runner = PipelineRunner(handle_sigint=handle_sigint, force_gc=True)
 
-    await runner.run(task)
+        await runner.run(task)
+    finally:
+        _release_turn_analyzer(turn_analyzer)
 
 
 async def bot(runner_args: RunnerArguments):
@@ -176,8 +270,9 @@ async def bot(runner_args: RunnerArguments):
     body_data = call_data.get("body", {})
     to_number = body_data.get("to_number")
     from_number = body_data.get("from_number")
+    record = body_data.get("record", "1") == "1"
 
-    logger.info(f"Call metadata - To: {to_number}, From: {from_number}")
+    logger.info(f"Call metadata - To: {to_number}, From: {from_number}, Record: {record}")
 
     serializer = TwilioFrameSerializer(
         stream_sid=call_data["stream_id"],
@@ -202,4 +297,4 @@ async def bot(runner_args: RunnerArguments):
 
     handle_sigint = runner_args.handle_sigint
 
-    await run_bot(transport, handle_sigint, call_sid=call_data["call_id"])
+    await run_bot(transport, handle_sigint, call_sid=call_data["call_id"], record=record)
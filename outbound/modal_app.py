@@ -9,6 +9,8 @@ After deploying, send a POST request to /dialout to initiate an outbound call:
     curl -X POST https://<workspace>--twilio-outbound-bot-serve.modal.run/dialout \\
       -H "Content-Type: application/json" \\
       -d '{"to_number": "+15551234567", "from_number": "+15559876543"}'
+
+Pass "record": false to skip the Twilio call recording (e.g. for test calls).
 """
 
 import modal
@@ -24,11 +26,13 @@ image = (
         "pipecat-ai[websocket,groq,silero,deepgram,rnnoise,runner,local-smart-turn-v3]>=0.0.99",
         "pipecatcloud>=0.2.18",
         "twilio",
+        "orjson",
         "python-dotenv",
         "requests",
     )
     .run_commands("python -c 'from pyrnnoise import RNNoise; RNNoise(sample_rate=48000)'")
     .add_local_file("bot.py", "/root/bot.py")
+    .add_local_file("server_utils.py", "/root/server_utils.py")
 )
 
 # ---------------------------------------------------------------------------
@@ -37,6 +41,27 @@ image = (
 
 app = modal.App("twilio-outbound-bot")
 
+# Calls served concurrently by one container. Each live call holds its own
+# Smart Turn analyzer, so serve() pre-loads this many.
+MAX_CALLS_PER_CONTAINER = 4
+
+# TwiML returned to Twilio for each call; only the stream URL and phone numbers
+# vary, so format a fixed string instead of building a VoiceResponse tree.
+# Values are passed through quoteattr, which supplies the surrounding quotes.
+_TWIML_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<Response>"
+    "<Connect>"
+    "<Stream url={ws_url}>"
+    '<Parameter name="to_number" value={to}/>'
+    '<Parameter name="from_number" value={frm}/>'
+    '<Parameter name="record" value={record}/>'
+    "</Stream>"
+    "</Connect>"
+    '<Pause length="20"/>'
+    "</Response>"
+)
+
 # ---------------------------------------------------------------------------
 # ASGI entrypoint
 # ---------------------------------------------------------------------------
@@ -47,24 +72,34 @@ app = modal.App("twilio-outbound-bot")
     secrets=[modal.Secret.from_dotenv(__file__)],
     scaledown_window=300,
     timeout=600,
-    keep_warm=0,
+    min_containers=1,
+    max_containers=10,
 )
+@modal.concurrent(max_inputs=MAX_CALLS_PER_CONTAINER)
 @modal.asgi_app()
 def serve():
     import os
-    import traceback
+    import sys
+    from xml.sax.saxutils import quoteattr
 
     from fastapi import FastAPI, HTTPException, Request, WebSocket
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import HTMLResponse
+    from fastapi.responses import HTMLResponse, ORJSONResponse
     from loguru import logger
     from twilio.rest import Client as TwilioClient
-    from twilio.twiml.voice_response import Connect, Stream, VoiceResponse
+
+    # Keep tracebacks on failures but skip loguru's per-frame variable capture.
+    logger.remove()
+    logger.add(sys.stderr, backtrace=False, diagnose=False)
 
     # Eagerly import bot and pipecat modules at container init (not per-request)
     # so the WebSocket handler doesn't pay import cost when Twilio connects.
-    from bot import bot
+    from bot import bot, prewarm_turn_analyzers
     from pipecat.runner.types import WebSocketRunnerArguments
+    from server_utils import dialout_request_from_request
+
+    # Load a Smart Turn model per concurrent call so no call blocks on it.
+    prewarm_turn_analyzers(MAX_CALLS_PER_CONTAINER)
 
     web_app = FastAPI()
 
@@ -83,9 +118,13 @@ def serve():
     @web_app.post("/dialout")
     async def handle_dialout(request: Request):
         """Initiate an outbound call via Twilio."""
-        data = await request.json()
-        to_number = data.get("to_number")
-        from_number = data.get("from_number")
+        # Validate with the Docker server's DialoutRequest, so "record" is parsed
+        # the same way ("false" -> False) and invalid bodies (e.g. "record": null)
+        # get a 400.
+        dialout_request = await dialout_request_from_request(request)
+        to_number = dialout_request.to_number
+        from_number = dialout_request.from_number
+        record = dialout_request.record
 
         if not to_number or not from_number:
             raise HTTPException(status_code=400, detail="to_number and from_number are required")
@@ -97,7 +136,7 @@ def serve():
 
         # Build TwiML URL from the incoming request's host
         host = request.headers.get("host", "")
-        twiml_url = f"https://{host}/twiml"
+        twiml_url = f"https://{host}/twiml" if record else f"https://{host}/twiml?record=0"
         logger.info(f"Initiating call to {to_number} with TwiML URL: {twiml_url}")
 
         client = TwilioClient(account_sid, auth_token)
@@ -105,7 +144,9 @@ def serve():
             to=to_number, from_=from_number, url=twiml_url, method="POST"
         )
 
-        return {"call_sid": call.sid, "status": "call_initiated", "to_number": to_number}
+        return ORJSONResponse(
+            {"call_sid": call.sid, "status": "call_initiated", "to_number": to_number}
+        )
 
     @web_app.post("/twiml")
     async def get_twiml(request: Request):
@@ -113,21 +154,19 @@ def serve():
         form_data = await request.form()
         to_number = form_data.get("To", "")
         from_number = form_data.get("From", "")
+        record = request.query_params.get("record", "1")
 
         host = request.headers.get("host", "")
         ws_url = f"wss://{host}/ws"
         logger.info(f"TwiML: directing Twilio stream to {ws_url}")
 
-        response = VoiceResponse()
-        connect = Connect()
-        stream = Stream(url=ws_url)
-        stream.parameter(name="to_number", value=to_number)
-        stream.parameter(name="from_number", value=from_number)
-        connect.append(stream)
-        response.append(connect)
-        response.pause(length=20)
-
-        return HTMLResponse(content=str(response), media_type="application/xml")
+        xml = _TWIML_TEMPLATE.format(
+            ws_url=quoteattr(ws_url),
+            to=quoteattr(to_number),
+            frm=quoteattr(from_number),
+            record=quoteattr(record),
+        )
+        return HTMLResponse(content=xml, media_type="application/xml")
 
     @web_app.websocket("/ws")
     async def websocket_endpoint(websocket: WebSocket):
@@ -138,8 +177,7 @@ def serve():
         try:
             runner_args = WebSocketRunnerArguments(websocket=websocket)
             await bot(runner_args)
-        except Exception as e:
-            logger.error(f"Error in bot pipeline: {type(e).__name__}: {e}")
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in bot pipeline")
 
     return web_app
@@ -36,7 +36,8 @@ async def handle_dialout_request(request: Request) -> DialoutResponse:
     """Handle outbound call request and initiate call via Twilio.
 
     Args:
-        request (Request): FastAPI request containing JSON with 'to_number' and 'from_number'.
+        request (Request): FastAPI request containing JSON with 'to_number', 'from_number'
+            and an optional 'record' flag.
 
     Returns:
         DialoutResponse: Response containing call_sid, status, and to_number.
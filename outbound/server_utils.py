@@ -22,10 +22,12 @@ class DialoutRequest(BaseModel):
     Attributes:
         to_number (str): The phone number to dial (E.164 format recommended).
         from_number (str): The Twilio phone number to call from (E.164 format).
+        record (bool): Whether to record the call via Twilio. Defaults to True.
     """
 
     to_number: str
     from_number: str
+    record: bool = True
 
 
 class TwilioCallResult(BaseModel):
@@ -60,10 +62,12 @@ class TwimlRequest(BaseModel):
     Attributes:
         to_number (str): The phone number being called.
         from_number (str): The phone number calling from.
+        record (bool): Whether the bot should start a Twilio recording.
     """
 
     to_number: str
     from_number: str
+    record: bool = True
 
 
 async def dialout_request_from_request(request: Request) -> DialoutRequest:
@@ -78,9 +82,11 @@ async def dialout_request_from_request(request: Request) -> DialoutRequest:
     Raises:
         HTTPException: If required fields are missing or request data is invalid.
     """
-    data = await request.json()
+    body = await request.body()
     try:
-        return DialoutRequest.model_validate(data)
+        # Validate straight from the raw bytes with pydantic-core's JSON parser
+        # instead of decoding to a dict with stdlib json first.
+        return DialoutRequest.model_validate_json(body)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid request data: {str(e)}")
 
@@ -109,6 +115,8 @@ async def make_twilio_call(dialout_request: DialoutRequest) -> TwilioCallResult:
         raise ValueError("Missing LOCAL_SERVER_URL")
 
     twiml_url = f"{local_server_url}/twiml"
+    if not dialout_request.record:
+        twiml_url += "?record=0"
     account_sid = os.getenv("TWILIO_ACCOUNT_SID")
     auth_token = os.getenv("TWILIO_AUTH_TOKEN")
 
@@ -126,7 +134,8 @@ async def parse_twiml_request(request: Request) -> TwimlRequest:
     """Parse and validate TwiML request data from Twilio.
 
     Twilio sends webhook data as form-encoded data, not JSON. This function
-    extracts the 'To' and 'From' phone numbers from the form data.
+    extracts the 'To' and 'From' phone numbers from the form data, and the
+    recording opt-out from the 'record' query parameter set by make_twilio_call.
 
     Args:
         request (Request): FastAPI request object containing Twilio form data.
@@ -139,7 +148,9 @@ async def parse_twiml_request(request: Request) -> TwimlRequest:
     to_number = form_data.get("To")
     from_number = form_data.get("From")
 
-    return TwimlRequest(to_number=to_number, from_number=from_number)
+    record = request.query_params.get("record", "1") == "1"
+
+    return TwimlRequest(to_number=to_number, from_number=from_number, record=record)
 
 
 def get_websocket_url() -> str:
@@ -197,6 +208,7 @@ def generate_twiml(twiml_request: TwimlRequest) -> str:
     # These will be available in the WebSocket 'start' message
     stream.parameter(name="to_number", value=twiml_request.to_number)
     stream.parameter(name="from_number", value=twiml_request.from_number)
+    stream.parameter(name="record", value="1" if twiml_request.record else "0")
 
     # Add Pipecat Cloud service host for production
     if os.getenv("ENV") == "production":
@@ -10,6 +10,7 @@ The server URL can be passed as an argument or falls back to LOCAL_SERVER_URL
 in .env (default: http://localhost:7860).
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -21,7 +22,7 @@ ENV_PATH = Path(__file__).resolve().parent.parent / "outbound" / ".env"
 load_dotenv(ENV_PATH, override=True)
 
 
-def main():
+async def main():
     to_number = os.getenv("TO_NUMBER")
     from_number = os.getenv("FROM_NUMBER")
 
@@ -41,7 +42,11 @@ def main():
     print(f"Calling {to_number} from {from_number}...")
     print(f"POST {url}")
 
-    response = httpx.post(url, json=payload, timeout=30)
+    # One pooled client, so the script can be extended to fire several calls
+    # over the same keep-alive connection instead of a new TCP/TLS handshake each.
+    limits = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        response = await client.post(url, json=payload)
 
     if response.status_code == 200:
         data = response.json()
@@ -52,4 +57,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())